@@ -11,23 +11,27 @@ Attributes:
     GAIN_128 (int): Configuration for Channel A, gain 128
     GAIN_32 (int): Configuration for Channel B, gain 32.
     GAIN_64 (int): Configuration for Channel A, gain 64.
+    VALID_GAINS (tuple): The allowed gain/channel configurations.
     instance_list (list): List of connected HX711 modules.
+    values (array.array): The value of each connected HX711, at the instance's index.
+    PIO_STATE_MACHINES (int): Number of RP2040 PIO state machines available for clocking in data.
+    PIO_FREQ (int): PIO state machine frequency (1 MHz, 1 microsecond per instruction).
+    hx711_pio: PIO program that clocks in the HX711 data.
+    SIO_GPIO_IN, SIO_GPIO_OUT_SET, SIO_GPIO_OUT_CLR (int): RP2040 SIO register addresses.
+    CLOCK_DELAY (int): Viper loop iterations that hold each PD_SCK level for about 1 us.
     read_timer (machine.Timer): Timer for periodic reading of all connected HX711 modules.
     SETTLING_TIME (int): Milliseconds needed after power up, reset, or configuration change.
     DATA_READY_TIMEOUT (int): Timeout for data ready indication (DOUT signal == 0).
+    MAX_ZEROS_TO_AVERAGE (int): The largest allowed Hx711.zeros_to_average.
 """
 import sys
-import _thread
+import array
 import time
 import machine
+import rp2
+import micropython
 from micropython import const
 
-DEBUG_ELAPSED = -1
-# start = time.ticks_us()
-# global DEBUG_ELAPSED
-# DEBUG_ELAPSED = time.ticks_diff(time.ticks_us(), start)
-
-
 # Status flags
 STATUS_NOMINAL = const(0)               # Not a flag; the value of status when no flags are set
 STATUS_INITIALIZING = const(1)
@@ -63,11 +67,12 @@ UPDATE_FREQ = const(10)
 
 MAX_RAW: int = const(0x7fffff)       # maximum 24-bit int (the HX711 outputs 24 bits)
 MIN_RAW: int = const(-0x800000)
-EXTEND_SIGN: int = const(0x1000000)  # subtract this from a 24-bit value to extend the sign
+SIGN_BIT: int = const(0x800000)      # (value ^ SIGN_BIT) - SIGN_BIT extends the sign of a 24-bit value
 
 GAIN_128: int = const(0)  # Configuration for Channel A, gain 128
 GAIN_64: int = const(2)   # Configuration for Channel A, gain 64
 GAIN_32: int = const(1)   # Configuration for Channel B, gain 32
+VALID_GAINS = (GAIN_128, GAIN_64, GAIN_32)
 
 # The settling time in milliseconds needed after a power up, reset,
 # or configuration change, when the sample rate is 10 per second
@@ -84,6 +89,62 @@ SETTLING_TIME = const(400)
 # DOUT signal to remain high before it sets STATUS_DATA_READY_TIMEOUT.
 DATA_READY_TIMEOUT = round(2000 / UPDATE_FREQ)    # milliseconds
 
+# The RP2040 has two PIO blocks with four state machines each. Instances
+# beyond that many fall back to clocking in the data from Python.
+PIO_STATE_MACHINES = const(8)
+PIO_FREQ = const(1_000_000)    # 1 us per PIO instruction
+
+# The HX711 read cycle, executed by a PIO state machine. read() puts
+# the number of additional clocks needed after the 25th (the
+# configuration) into the TX FIFO. The program then sends 25 clocks,
+# sampling DOUT on each, and autopush delivers the 24 data bits
+# followed by the state of DOUT after the 25th clock to the RX FIFO
+# as one 25-bit word. The additional clocks follow.
+# PD_SCK stays high for 2 us per clock, well within the HX711's
+# 0.2 to 50 us pulse width limits.
+@rp2.asm_pio(set_init=rp2.PIO.OUT_LOW, in_shiftdir=rp2.PIO.SHIFT_LEFT, autopush=True, push_thresh=25)
+def hx711_pio():
+    label("request")
+    pull()                  # wait for read(); OSR = configuration
+    mov(x, osr)
+    set(y, 24)              # 25 clocks
+    label("bit")
+    set(pins, 1)            # PD_SCK high
+    in_(pins, 1)            # DOUT is valid 0.1 us after PD_SCK goes high
+    set(pins, 0)
+    jmp(y_dec, "bit")
+    label("extra")          # select the gain/channel for the next conversion
+    jmp(not_x, "request")
+    set(pins, 1)
+    set(pins, 0)
+    jmp(x_dec, "extra")
+
+# set_clock() instructions for a state machine running hx711_pio, encoded
+# once here rather than assembled from source on every sm.exec() call
+_SET_CLOCK_HIGH = rp2.asm_pio_encode("set(pins, 1)", 0)
+_SET_CLOCK_LOW = rp2.asm_pio_encode("set(pins, 0)", 0)
+
+# RP2040 SIO registers, for clocking in the data without a PIO state machine.
+# Writing a pin mask to OUT_SET or OUT_CLR drives only those pins.
+SIO_GPIO_IN = const(0xd0000004)
+SIO_GPIO_OUT_SET = const(0xd0000014)
+SIO_GPIO_OUT_CLR = const(0xd0000018)
+
+# Native code toggles PD_SCK much faster than the HX711's 0.2 us minimum
+# pulse width. This many empty viper loop iterations take about 1 us
+# at 125 MHz.
+CLOCK_DELAY = const(32)
+
+# The most readings zero_now() can average: 256 24-bit values still sum
+# to a 32-bit word (see Hx711._scalars).
+MAX_ZEROS_TO_AVERAGE = const(256)
+
+# Indexes into an Hx711 instance's _scalars array
+_ZEROING_SUM = const(0)
+_VALUES_RECEIVED = const(1)
+_OFFSET = const(2)
+
+@micropython.native
 def validate_gain(gain):
     """
     Ensure the gain value is one of the allowed values,
@@ -92,7 +153,7 @@ def validate_gain(gain):
     Raises:
         ValueError: If an invalid gain value is provided.
     """
-    if not (gain == GAIN_128 or gain == GAIN_64 or gain == GAIN_32):
+    if gain not in VALID_GAINS:
         raise ValueError(f"Invalid gain value: {gain}. Must be hx711.GAIN_128, hx711.GAIN_64, or hx711.GAIN_32")
 
 def discard_timer(timer):
@@ -107,19 +168,76 @@ def discard_timer(timer):
     timer.deinit()
     timer = None
 
+@micropython.viper
+def shift_in_24(clock_pin_no: int, data_pin_no: int) -> int:
+    """
+    Clock in the 24 HX711 data bits by writing the SIO registers directly.
+    The pins must be under SIO control (not assigned to a state machine).
+
+    Args:
+        clock_pin_no (int): GPIO pin number connected to HX711 signal PD_SCK.
+        data_pin_no (int): GPIO pin number connected to HX711 signal DOUT.
+
+    Returns:
+        int: The 24 data bits.
+    """
+    gpio_in = ptr32(SIO_GPIO_IN)
+    gpio_set = ptr32(SIO_GPIO_OUT_SET)
+    gpio_clr = ptr32(SIO_GPIO_OUT_CLR)
+    clock_mask = 1 << clock_pin_no
+    data = 0
+    for j in range(24):
+        gpio_set[0] = clock_mask
+        for k in range(CLOCK_DELAY):    # pulse time should be 0.2 to 50 microseconds
+            pass
+        gpio_clr[0] = clock_mask
+        for k in range(CLOCK_DELAY):
+            pass
+        data = (data << 1) | ((gpio_in[0] >> data_pin_no) & 1)
+    return data
+
+def free_index():
+    """
+    Find the lowest index not assigned to any connected HX711.
+
+    Returns:
+        int: The index.
+    """
+    used = [item.index for item in instance_list]
+    index = 0
+    while index in used:
+        index += 1
+    return index
+
 def read_all(timer):
     """
     Retrieve a new value from each connected HX711.
 
+    read_timer's callback is the only place the connected instances are
+    read, so Hx711.read() is never re-entered and needs no lock. (The
+    read in set_gain() during __init__ happens before the instance
+    joins instance_list.) Any other caller of read(), set_gain(), or
+    reset() must first stop read_timer.
+
     Args:
         timer (machine.Timer): Timer triggering the reading.
     """
-    
-    # It takes about 3.4 milliseconds to complete this loop with two instances
+    # Start every instance's state machine before collecting any results,
+    # so the HX711s are clocked concurrently. Bit-banged instances take
+    # about 1.5 ms each, all in the second loop.
     for item in instance_list:
-        item.read()
+        item.start_read()
+    for item in instance_list:
+        item.finish_read()
     
 instance_list = []
+values = array.array('f')   # lets a client fetch every value without touching the instances
+
+# rp2 machine.Timer callbacks are soft by default: the timer interrupt only
+# schedules the callback, which then runs at the next safe point, just like
+# micropython.schedule(). So read_all never runs in the hardware IRQ, and
+# wrapping it in another micropython.schedule() would only add latency.
+# Don't make this a hard timer; read_all allocates (float results).
 read_timer = machine.Timer(mode=machine.Timer.PERIODIC, freq=UPDATE_FREQ, callback=read_all)
 
 class Hx711:
@@ -128,14 +246,18 @@ class Hx711:
 
     Attributes:
         name (str): Identifier for this instance.
+        index (int): Distinguishes this instance from the others in instance_list; also its PIO state machine id.
+        sm (rp2.StateMachine): PIO state machine that clocks in the data, or None if none was available.
+        read_pending (bool): True between a start_read() that found data ready and the matching finish_read().
         status (int): Current status flags indicating the state of the Hx711 instance.
         clock_pin_no (int): GPIO pin number connected to HX711 signal PD_SCK ("Power Down, Signal Clock").
         data_pin_no (int): GPIO pin number connected to HX711 signal DOUT ("Data OUTput").
         configuration (int): Selects the HX711 PGIA gain and input channel; 128 and A by default; use the GAIN_ constants.
         offset (int): Offset correction to be subtracted from the HX711 ADC output.
         gain (float): Multiplier to convert the offset-corrected HX711 output count to meaningful units.
-        zeros_to_average (int): Number of consecutive read values to use when calculating the default self.offset.
-        value (float): The adjusted result: value = (HX711 data output - offset) * gain.
+        zeros_to_average (int): Number of consecutive read values to use when calculating the default self.offset (0 to MAX_ZEROS_TO_AVERAGE).
+        dfs (float): Digital filter stability, the weight of the previous value when averaging in a new one; 0 disables filtering.
+        value (float): The adjusted result: value = (HX711 data output - offset) * gain. Also kept in hx711.values[index].
         
     Methods:
         __init__(self, clock_pin_no, data_pin_no, gain=GAIN_128):
@@ -150,7 +272,7 @@ class Hx711:
                 ValueError: If an invalid gain value is provided.
 
         __del__(self):
-            Destructor. Power down and release the timers when the instance is deleted.
+            Destructor. Power down and release the timers and state machine when the instance is deleted.
 
         clear_status(self, flags):
             Clear the given status flags.
@@ -171,7 +293,13 @@ class Hx711:
                 flags (int): Status flags to check.
 
             Returns:
-                bool: True if any of the status flags are set, or if flags is STATUS_NOMINAL and none are set; False otherwise.
+                bool: True if any of the status flags are set, False otherwise.
+
+        is_nominal(self):
+            Check if no status flags are set.
+
+            Returns:
+                bool: True if the status is STATUS_NOMINAL, False otherwise.
 
         set_gain(self, gain=GAIN_128):
             Ensure the specified HX711 gain / channel is configured.
@@ -185,6 +313,12 @@ class Hx711:
             Raises:
                 ValueError: If an invalid gain value is provided.
 
+        set_clock(self, state):
+            Drive the HX711 PD_SCK signal, through the PIO state machine if there is one.
+
+            Args:
+                state (bool): True for high, False for low.
+
         power_down(self):
             Power down the HX711.
 
@@ -239,11 +373,30 @@ class Hx711:
                 bool: True if data is ready within the specified timeout, False otherwise.
 
         clock_a_data_bit(self):
-            Send a clock pulse and return the state of the data line.
+            Send a clock pulse and return the state of the data line. Only for use without a PIO state machine.
 
             Returns:
                 int: State of the data line (1 or 0).
 
+        shift_in(self):
+            Clock in the data without a PIO state machine.
+
+            Returns:
+                int: The 24 data bits followed by the state of the data line after the 25th clock.
+
+        start_read(self):
+            If data is ready, start the PIO state machine clocking it in.
+
+            Returns:
+                bool: True if data is ready, False otherwise.
+
+        finish_read(self):
+            Complete the reading begun by start_read() and save the adjusted result in
+            the Hx711 value attribute.
+
+            Returns:
+                float: gain * (ADC count - offset)
+
         read(self):
             Acquire the ADC count from the HX711 and save the adjusted result in
             the Hx711 value attribute.
@@ -270,32 +423,49 @@ class Hx711:
         self.status = STATUS_INITIALIZING
         validate_gain(gain)
         self.name = f"Hx711({clock_pin_no},{data_pin_no}): "
-        self.lock = _thread.allocate_lock()
+        self.index = free_index()
         self.clock_pin_no = clock_pin_no  # HX711 signal PD_SCK ("Power Down, Signal ClocK")
         self.clock = machine.Pin(clock_pin_no, machine.Pin.OUT)
+        self._clk = self.clock.value    # bound once, to skip the lookups on each call
+        self.clock_mask = 1 << clock_pin_no  # for the SIO registers
         self.data_pin_no = data_pin_no  # HX711 signal DOUT ("Data OUTput")
         self.data = machine.Pin(data_pin_no, machine.Pin.IN)
+        self._dat = self.data.value
+        self.read_pending = False   # set by start_read(), cleared by finish_read()
+        self.sm = None
+        if self.index < PIO_STATE_MACHINES:
+            self.sm = rp2.StateMachine(self.index, hx711_pio, freq=PIO_FREQ, set_base=self.clock, in_base=self.data)
+            self.sm.active(1)
         self.configuration = GAIN_128  # input A, gain 128 (HX711 default)
         self.data_ready_timer = None
         self.settled_timer = None
+        # zeroing_sum, values_received, and offset, as machine words in one
+        # small block rather than three instance attributes
+        self._scalars = array.array('l', (0, 0, 0))
         self.offset = 0
         self.gain = 1.0
-        self.dfs = 0.0    # digital filter stablity; see weighted_average()
+        self.dfs = 0.0    # digital filter stablity; see the dfs property
         self.zeros_to_average = 50    # about 5 seconds
         self.value = 0
+        while len(values) <= self.index:
+            values.append(0.0)
+        values[self.index] = 0.0
         self.reset()
         instance_list.append(self)
         self.clear_status(STATUS_INITIALIZING)
 
     def __del__(self):
         """
-        Destructor. Power down and release timers when the instance is deleted.
+        Destructor. Power down and release timers and the state machine when the instance is deleted.
         """
         instance_list.remove(self)
         self.power_down()
         discard_timer(self.data_ready_timer)
         discard_timer(self.settled_timer)
+        if self.sm is not None:
+            self.sm.active(0)   # PD_SCK stays high, keeping the HX711 powered down
 
+    @micropython.native
     def clear_status(self, flags):
         """
         Clear the given status flags.
@@ -305,6 +475,7 @@ class Hx711:
         """
         self.status &= ~flags
         
+    @micropython.native
     def set_status(self, flags):
         """
         Set the given status flags.
@@ -314,6 +485,7 @@ class Hx711:
         """
         self.status |= flags
 
+    @micropython.native
     def status_contains(self, flags):
         """
         Check if any of the specified status flags are set.
@@ -322,12 +494,19 @@ class Hx711:
             flags (int): Status flags to check.
 
         Returns:
-            bool: True if any of the status flags are set, or if flags is STATUS_NOMINAL and none are set; False otherwise.
+            bool: True if any of the status flags are set, False otherwise.
         """
-        if (flags == STATUS_NOMINAL):
-            return self.status == STATUS_NOMINAL
         return bool(self.status & flags)
 
+    def is_nominal(self):
+        """
+        Check if no status flags are set.
+
+        Returns:
+            bool: True if the status is STATUS_NOMINAL, False otherwise.
+        """
+        return self.status == STATUS_NOMINAL
+
     def set_gain(self, gain=GAIN_128):
         """
         Ensure the desired gain / channel are selected.
@@ -354,6 +533,20 @@ class Hx711:
         
         return False
 
+    def set_clock(self, state):
+        """
+        Drive the HX711 PD_SCK signal high or low. When the instance has
+        a PIO state machine, the clock pin belongs to it, so the state
+        machine sets the pin.
+
+        Args:
+            state (bool): True for high, False for low.
+        """
+        if self.sm is None:
+            self._clk(state)
+        else:
+            self.sm.exec(_SET_CLOCK_HIGH if state else _SET_CLOCK_LOW)
+
     def power_down(self):
         """
         Power down the HX711.
@@ -364,7 +557,7 @@ class Hx711:
         # Seting the status at the beginning is slightly premature, but correct
         # on the presumption that anything checking would prefer this meaning.
         self.set_status(STATUS_POWERED_DOWN | STATUS_NOT_SETTLED)   # | meaning both
-        self.clock(True)
+        self.set_clock(True)
         time.sleep_us(60)
 
     def power_up(self):
@@ -376,7 +569,7 @@ class Hx711:
         """
         self.set_status(STATUS_POWERING_UP | STATUS_NOT_SETTLED)
         self.zero_now()
-        self.clock(False)  # HX711 power-up signal
+        self.set_clock(False)  # HX711 power-up signal
         self.clear_status(STATUS_POWERED_DOWN)
         discard_timer(self.settled_timer)
         self.settled_timer = machine.Timer(period=SETTLING_TIME, mode=machine.Timer.ONE_SHOT, callback=self.settled_timeout)
@@ -440,7 +633,7 @@ class Hx711:
         Returns:
             bool: True if data is ready, False otherwise.
         """
-        ready = self.data() == 0  # AD conversion complete
+        ready = self._dat() == 0  # AD conversion complete
         if ready:
             discard_timer(self.data_ready_timer)
             self.clear_status(STATUS_DATA_NOT_READY | STATUS_DATA_READY_TIMEOUT)
@@ -460,109 +653,211 @@ class Hx711:
         Returns:
             bool: True if data is ready within the specified timeout, False otherwise.
         """
-        for ms in range(timeout):
+        deadline = time.ticks_add(time.ticks_ms(), timeout)
+        while time.ticks_diff(deadline, time.ticks_ms()) > 0:
             if self.data_ready():
                 return True
             time.sleep_ms(1)
         return False
 
+    @micropython.native
     def clock_a_data_bit(self):
         """
         Send a clock pulse and return the state of the data line.
+        This writes the SIO registers directly, so it only works while
+        the pins are not assigned to a PIO state machine.
 
         Returns:
             int: State of the data line (1 or 0).
         """
-        self.clock(True)
-        time.sleep_us(1)  # pulse time should be 0.2 to 50 microseconds (1 us is nominal)
-        self.clock(False)
+        # Pulse time should be 0.2 to 50 microseconds. Unlike the viper loop in
+        # shift_in_24(), a machine.mem32 store from Python takes longer than
+        # 0.2 us by itself, so no explicit delay is needed; time.sleep_us(1)
+        # only added overshoot.
+        machine.mem32[SIO_GPIO_OUT_SET] = self.clock_mask
+        machine.mem32[SIO_GPIO_OUT_CLR] = self.clock_mask
         # no need to wait here; data is already valid 0.1 us after clock goes high
-        return self.data()
+        return (machine.mem32[SIO_GPIO_IN] >> self.data_pin_no) & 1
 
-    def weighted_average(self, value):
-        return self.value * self.dfs + value * (1 - self.dfs)
+    def shift_in(self):
+        """
+        Clock in the data without a PIO state machine.
 
-    def read(self):
+        Returns:
+            int: The 24 data bits followed by the state of the data line after the 25th clock.
         """
-        Attempt to read the ADC count from the HX711 and save the adjusted result in
-        the Hx711 value attribute. If new data is not ready or an error is 
-        encountered, return the previous valid result.
+        # The total number of clocks selects the input and sets the ADC gain:
+        #     25 clocks selects input A, gain = 128
+        #     26 clocks selects input B, gain = 32
+        #     27 clocks selects input A, gain = 64.
+        data = shift_in_24(self.clock_pin_no, self.data_pin_no)
+        data = (data << 1) | self.clock_a_data_bit()    # the 25th clock
+
+        # Additional clocks to finish selecting or confirming the HX711 
+        # gain/channel configuration.
+        # This must be done after every data read. GAIN_128 (0) needs none,
+        # and DOUT needn't be sampled for these, so just pulse the clock.
+        configuration = self.configuration
+        if configuration:
+            clock_mask = self.clock_mask
+            for j in range(configuration):
+                machine.mem32[SIO_GPIO_OUT_SET] = clock_mask  # see clock_a_data_bit()
+                machine.mem32[SIO_GPIO_OUT_CLR] = clock_mask
+        return data
+
+    @property
+    def offset(self):
+        """
+        Offset correction to be subtracted from the HX711 ADC output.
+        """
+        return self._scalars[_OFFSET]
+
+    @offset.setter
+    def offset(self, value):
+        self._scalars[_OFFSET] = int(round(value))
+
+    @property
+    def zeros_to_average(self):
+        """
+        Number of consecutive read values to use when calculating the default offset.
+        """
+        return self._zeros_to_average
+
+    @zeros_to_average.setter
+    def zeros_to_average(self, value):
+        """
+        Stored as an int; the zeroing arithmetic in finish_read() must stay
+        integral to fit the _scalars array.
+
+        Raises:
+            ValueError: If value is not 0 to MAX_ZEROS_TO_AVERAGE; more
+            readings could overflow the zeroing sum's 32-bit word.
+        """
+        value = int(value)
+        if not 0 <= value <= MAX_ZEROS_TO_AVERAGE:
+            raise ValueError(f"Invalid zeros_to_average: {value}. Must be 0 to {MAX_ZEROS_TO_AVERAGE}")
+        self._zeros_to_average = value
+
+    @property
+    def dfs(self):
+        """
+        Digital filter stability: the weight given to the previous value when
+        averaging in a new reading. Filtering is applied only if 0 < dfs < 1.
+        """
+        return self._dfs
+
+    @dfs.setter
+    def dfs(self, value):
+        self._dfs = value
+        self._one_minus_dfs = 1 - value  # precomputed for finish_read()
+
+    def start_read(self):
+        """
+        Check for new data and, if it is ready and the instance has a PIO
+        state machine, start the state machine clocking it in. The state
+        machine runs on its own; finish_read() collects the result.
 
         Returns:
-            float: gain * (ADC count - offset)
+            bool: True if data is ready, False otherwise.
         """
-        # It takes about 1.5 ms to complete a normal reading without weighted averaging
-        # and about 1.7 or 1.8 ms with it.
-        
         if self.data_ready():
             self.clear_status(STATUS_NO_DATA)
         else:
             self.set_status(STATUS_NO_DATA)
+            return False
+
+        if self.sm is not None:
+            self.sm.put(self.configuration)
+        self.read_pending = True
+        return True
+
+    def finish_read(self):
+        """
+        Complete the reading begun by start_read() and save the adjusted
+        result in the Hx711 value attribute. If no reading is pending (new
+        data was not ready, or start_read() wasn't called), or an error is
+        encountered, return the previous valid result.
+
+        Returns:
+            float: gain * (ADC count - offset)
+        """
+        # Without a PIO state machine, it takes about 1.5 ms to complete a normal
+        # reading without weighted averaging and about 1.7 or 1.8 ms with it.
+
+        # Without a pending reading, the state machine has nothing to
+        # deliver, and sm.get() would block forever.
+        if not self.read_pending:
             return self.value
-        
-        with self.lock:
-            # Shift in the 24 data bits and set the gain.
-            data = 0
-            for j in range(24):
-                data <<= 1
-                data |= self.clock_a_data_bit()
-
-            # The total number of clocks selects the input and sets the ADC gain:
-            #     25 clocks selects input A, gain = 128
-            #     26 clocks selects input B, gain = 32
-            #     27 clocks selects input A, gain = 64.
-            # A minimum of 25 clocks are required, and the HX711 should always
-            # set the Data signal high after the 25th clock is sent.
-
-            # The 25th clock:
-            if self.clock_a_data_bit() == 1:
-                self.clear_status(STATUS_DOUT_STUCK_LOW)
-            else:
-                self.set_status(STATUS_DOUT_STUCK_LOW)
-                return self.value
-
-            # Additional clocks to finish selecting or confirming the HX711 
-            # gain/channel configuration.
-            # This must be done after every data read.
-            for j in range(self.configuration):
-                self.clock_a_data_bit()
-
-            #print(f"{self.name} raw: 0x{data:08x} = {data}")
-            if data > MAX_RAW:          # it's negative
-                data -= EXTEND_SIGN     # extend the sign
-            if data == MAX_RAW or data == MIN_RAW:
-                self.set_status(STATUS_OUT_OF_RANGE)
-            else:
-                self.clear_status(STATUS_OUT_OF_RANGE)
-            #print(f"{self.name} data = {data}")
-
-            # only increment values_received if the HX711 is settled
-            if self.settled():
-                # first handle zeroing if necessary
-                if self.values_received < self.zeros_to_average:
-                    self.zeroing_sum += data
-                elif self.status_contains(STATUS_ZEROING) and self.values_received >= self.zeros_to_average:
-                    if self.zeros_to_average > 0:
-                        self.offset = round(self.zeroing_sum / self.zeros_to_average)
-                    self.clear_status(STATUS_ZEROING)
-                elif self.values_received == sys.maxsize:
-                    # avoid re-zeroing if the counter ever rolls over
-                    self.values_received = self.zeros_to_average                    
-
-                self.values_received += 1
-
-                if self.status == STATUS_NOMINAL:
-                    data = self.gain * (data - self.offset)
+        self.read_pending = False
+
+        # Shift in the 24 data bits and set the gain.
+        if self.sm is None:
+            data = self.shift_in()
+        else:
+            data = self.sm.get()
+
+        # A minimum of 25 clocks are required, and the HX711 should always
+        # set the Data signal high after the 25th clock is sent.
+        if data & 1:
+            self.clear_status(STATUS_DOUT_STUCK_LOW)
+        else:
+            self.set_status(STATUS_DOUT_STUCK_LOW)
+            return self.value
+        data >>= 1
+
+        #print(f"{self.name} raw: 0x{data:08x} = {data}")
+        data = (data ^ SIGN_BIT) - SIGN_BIT     # extend the sign
+        if data == MAX_RAW or data == MIN_RAW:
+            self.set_status(STATUS_OUT_OF_RANGE)
+        else:
+            self.clear_status(STATUS_OUT_OF_RANGE)
+        #print(f"{self.name} data = {data}")
+
+        # only increment values_received if the HX711 is settled
+        if self.settled():
+            scalars = self._scalars
+            zeros_to_average = self._zeros_to_average
+            # first handle zeroing if necessary
+            if scalars[_VALUES_RECEIVED] < zeros_to_average:
+                scalars[_ZEROING_SUM] += data
+            elif self.status_contains(STATUS_ZEROING):
+                if zeros_to_average > 0:
+                    # integer division rounded to nearest; no float conversion
+                    scalars[_OFFSET] = (scalars[_ZEROING_SUM] + zeros_to_average // 2) // zeros_to_average
+                self.clear_status(STATUS_ZEROING)
+            elif scalars[_VALUES_RECEIVED] == sys.maxsize:
+                # avoid re-zeroing if the counter ever rolls over
+                scalars[_VALUES_RECEIVED] = zeros_to_average
+
+            scalars[_VALUES_RECEIVED] += 1
+
+            if self.status == STATUS_NOMINAL:
+                data = self.gain * (data - scalars[_OFFSET])
+                
+                if 0 < self._dfs < 1 and scalars[_VALUES_RECEIVED] > zeros_to_average:
+                    data = self.value * self._dfs + data * self._one_minus_dfs
                     
-                    if self.dfs > 0 and self.dfs < 1 and self.values_received > self.zeros_to_average:
-                        data = self.weighted_average(data)
-                        
-                    self.value = data
-            
+                self.value = data
+                values[self.index] = data
+
+        return self.value
+
+    def read(self):
+        """
+        Attempt to read the ADC count from the HX711 and save the adjusted result in
+        the Hx711 value attribute. If new data is not ready or an error is 
+        encountered, return the previous valid result.
+
+        Returns:
+            float: gain * (ADC count - offset)
+        """
+        self.start_read()
+        return self.finish_read()
+
     def zero_now(self):
         """
         Begin averaging readings to find the HX711 zero.
         """
-        self.zeroing_sum = 0;
-        self.set_status(STATUS_ZEROING);
-        self.values_received = 0
+        self._scalars[_ZEROING_SUM] = 0
+        self.set_status(STATUS_ZEROING)
+        self._scalars[_VALUES_RECEIVED] = 0
@@ -15,12 +15,15 @@ try:
     # how often to run garbage collection
     GC_PERIOD = 2000 # every 2 seconds
     
-    # Hz, maximum commands per second (minimum command pacing: ~20 ms)
-    POLL_FREQ = 50
+    # milliseconds the idle loop waits for input before checking whether to keep running
+    IDLE_TIMEOUT = 1000
     
     # microseconds to wait for a command (at 0, we're really just checking if one has already been received)
     POLL_TIMEOUT = 0
 
+    # bytes; the longest command accepted (longer input is rejected entirely)
+    INPUT_BUFFER_SIZE = 64
+
     # Hz, how fast to flash the Pico LED to indicate the program is running.
     FLASH_FREQ = 3
 
@@ -53,17 +56,19 @@ try:
             return False
 
     def getch():
-        return sys.stdin.read(1)        
+        """
+        Read one byte from stdin, undecoded and without allocating.
+        (readinto() on the blocking stdin stream waits until the whole
+        buffer is filled, so only one known-available byte is read at a time.)
+        """
+        sys.stdin.buffer.readinto(input_byte)
+        return input_byte[0]
 
-    def get_input(timer=None):
+    def get_input():
         """
         Do nothing unless the global variable input_text is free (empty).
         Check stdin for data. If new input has been received, store it in input_text
         and trigger the command processor.
-
-        Args:
-            timer (machine.Timer): Allows get_input to function as a timer callback. This
-            value is not used within the function.
         """
         global input_text
         
@@ -76,21 +81,36 @@ try:
             # wait for the entire command. 20 characters take about 1.8 ms at 115200 baud.
             time.sleep_ms(3)
             
-            # Because python lists are mutable and strings are not, 
-            # append + join should become faster than repeated concatenation
-            # at some point due to fewer memory allocations. I don't know
-            # where the crossover occurs, but I imagine that any added expense
-            # of the list approach should be negligible at the low end.
-            buf = [getch()] # buf is a list
+            # Collect the characters in the preallocated input_buffer rather
+            # than building a list of one-character strings.
+            n = 0
+            overflow = False
             while detect_input():
-                buf.append(getch())
-            buf = ''.join(buf) # now buf is a string
-            buf = buf.strip();
+                c = getch()
+                if n < INPUT_BUFFER_SIZE:
+                    input_buffer[n] = c
+                    n += 1
+                else:
+                    overflow = True     # keep draining stdin, but don't run a truncated command
+            if overflow:
+                buf = ''
+            else:
+                try:
+                    buf = str(input_view[:n], 'utf-8').strip()
+                except UnicodeError:
+                    # line noise; no valid command contains it, so drop the input
+                    buf = ''
             if buf:
 #               print(f"{time.ticks_us()} input_text = '{input_text}': {len(input_text)}")
                 with input_lock:
                     input_text = buf
-                machine.Timer(period=0, mode=machine.Timer.ONE_SHOT, callback=process_command)
+                # get_input already runs in the idle loop, not an interrupt. Report
+                # a failing command and carry on, as the timer callback used to,
+                # rather than letting it end the program.
+                try:
+                    process_command()
+                except Exception as e:
+                    sys.print_exception(e)
 
     def gc_collect(timer=None):
         pre = gc.mem_free()
@@ -125,12 +145,12 @@ try:
         return command, [tolerant_float(token) for token in tokens[1:]]
 
     def report(timer=None):
-        bridge1 = hx1.value
-        bridge2 = hx2.value
-        both = bridge1+bridge2
-        print(f"{both: 8.2f} {bridge1: 8.2f} {bridge2: 8.2f}")
+        values = hx711.values
+        bridge1 = values[hx1.index]
+        bridge2 = values[hx2.index]
+        print("% 8.2f % 8.2f % 8.2f" % (bridge1 + bridge2, bridge1, bridge2))
         
-    def process_command(timer):
+    def process_command():
         command, numbers = parse_command_string(get_command())
 #       print(f"'{command}' {numbers} Free Memory: {gc.mem_free()} bytes ({gc_collected} collected)")
         if command:
@@ -162,7 +182,6 @@ try:
                 global running
                 running = False
 #           print(f"command processing time: {time.ticks_diff(time.ticks_us(), start)} us")
-            discard_timer(timer)
 
 #==================================================================================#
 # main code (scoped here at the module level for trivial access to these globals)
@@ -172,23 +191,37 @@ try:
     
     hx1 = hx711.Hx711(HX1_CLOCK, HX1_DATA)
     hx2 = hx711.Hx711(HX2_CLOCK, HX2_DATA)
+
+    # hx711.read_all() specialized for exactly these two bridges: the bound
+    # methods are resolved once, here, instead of on every tick.
+    def read_bridges(timer, start1=hx1.start_read, start2=hx2.start_read,
+            finish1=hx1.finish_read, finish2=hx2.finish_read):
+        start1()
+        start2()
+        finish1()
+        finish2()
+
+    # a soft callback, like the original; see the note on hx711.read_timer
+    hx711.read_timer.init(mode=machine.Timer.PERIODIC, freq=hx711.UPDATE_FREQ, callback=read_bridges)
     
     pico_led = machine.Pin("LED", machine.Pin.OUT)
     flash_timer = machine.Timer(freq=FLASH_FREQ, callback=flash_led)
     
     input_text = ''
+    input_buffer = bytearray(INPUT_BUFFER_SIZE)
+    input_view = memoryview(input_buffer)
+    input_byte = bytearray(1)
     input_lock = _thread.allocate_lock()    
     poller = select.poll()
     poller.register(sys.stdin, select.POLLIN)
     report_timer = None
-    poll_timer = machine.Timer(freq=POLL_FREQ, callback=get_input)
 
-    # idle loop
+    # idle loop: sleep until input arrives, instead of waking a timer to poll for it
     while running:
-        time.sleep_ms(1000)
+        if poller.poll(IDLE_TIMEOUT):
+            get_input()
 
     discard_timer(report_timer)
-    discard_timer(poll_timer)
     discard_timer(gc_timer)
     discard_timer(flash_timer)
     hx1.power_down()